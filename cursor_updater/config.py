@@ -7,17 +7,20 @@ import re
 CURSOR_APPIMAGE = Path.home() / ".local" / "bin" / "cursor.AppImage"
 DOWNLOADS_DIR = Path.home() / ".local" / "share" / "cursor-updater" / "app-images"
 CACHE_FILE = Path("/tmp/cursor_versions.json")
+APPIMAGE_VERSION_CACHE_FILE = Path("/tmp/cursor_appimage_versions.json")
 
 # Cache settings
 CACHE_MAX_AGE = 15 * 60  # 15 minutes
+STATUS_CACHE_MAX_AGE = 5  # seconds to reuse local version/launch status
 
 # Network settings
 VERSION_HISTORY_URL = (
     "https://raw.githubusercontent.com/oslook/cursor-ai-downloads/"
     "refs/heads/main/version-history.json"
 )
-CHUNK_SIZE = 8192
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
 DOWNLOAD_TIMEOUT = 30
+DOWNLOAD_WORKERS = 4  # parallel range requests per download
 REQUEST_TIMEOUT = 10
 USER_AGENT = "Cursor-Updater/1.0"
 
@@ -28,6 +31,7 @@ YELLOW = "\033[33m"
 NC = "\033[0m"
 BOLD = "\033[1m"
 BOLD_BLUE = "\033[1;34m"
+CLEAR_SCREEN = "\033[H\033[2J\033[3J"  # home, clear screen, clear scrollback
 
 # Patterns
 VERSION_PATTERN = re.compile(r"cursor-([0-9.]+)\.AppImage", re.IGNORECASE)
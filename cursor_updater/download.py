@@ -1,23 +1,55 @@
 """Download and file management for Cursor Updater."""
 
+import errno
+import functools
+import hashlib
 import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from typing import Optional
 
 from cursor_updater.config import (
     DOWNLOADS_DIR,
     CURSOR_APPIMAGE,
     CHUNK_SIZE,
     DOWNLOAD_TIMEOUT,
+    DOWNLOAD_WORKERS,
     USER_AGENT,
     DESKTOP_FILE,
     CURSOR_APPIMAGE_PATTERNS,
 )
-from cursor_updater.version import get_download_url, get_running_cursor_path
+from cursor_updater.version import (
+    get_download_url,
+    get_running_cursor_path,
+    list_local_appimages,
+)
 from cursor_updater.output import print_error, print_success, print_info
 
+PROGRESS_INTERVAL = 0.02  # redraw the progress line at most 50 times a second
+PROGRESS_FLUSH_INTERVAL = 1.0  # push buffered progress to the terminal once a second
+
+_EXEC_LINE_RE = re.compile(r"^Exec=(.*)$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=1)
+def _opener():
+    """Shared opener so every download request carries the same headers.
+
+    urllib.request is imported here since it is slow to load and only
+    needed once a download starts.
+    """
+    from urllib.request import build_opener
+
+    opener = build_opener()
+    opener.addheaders = [("User-Agent", USER_AGENT)]
+    return opener
+
 
+@functools.lru_cache(maxsize=None)
 def get_appimage_path(version: str) -> Path:
     """Get the path to an AppImage file for a given version."""
     return DOWNLOADS_DIR / f"cursor-{version}.AppImage"
@@ -33,35 +65,270 @@ def _show_download_progress(downloaded: int, total_size: int) -> None:
     percent = (downloaded / total_size) * 100
     mb_downloaded = bytes_to_mb(downloaded)
     mb_total = bytes_to_mb(total_size)
-    print(f"\r   {percent:.1f}% ({mb_downloaded}MB/{mb_total}MB)", end="", flush=True)
-
-
-def download_file(url: str, filepath: Path) -> bool:
-    """Download a file with progress indication."""
+    print(f"\r   {percent:.1f}% ({mb_downloaded}MB/{mb_total}MB)", end="")
+
+
+class _DownloadProgress:
+    """Thread-safe byte counter that redraws the download progress line."""
+
+    def __init__(self, total_size: int):
+        self.total_size = total_size
+        self.downloaded = 0
+        self.last_print_ts = 0.0
+        self.last_flush_ts = 0.0
+        self.last_permille = -1
+        self.lock = threading.Lock()
+
+    def advance(self, n: int) -> None:
+        """Record n new bytes, redrawing at most PROGRESS_INTERVAL apart."""
+        with self.lock:
+            self.downloaded += n
+            if self.total_size <= 0:
+                return
+
+            permille = self.downloaded * 1000 // self.total_size
+            now = time.monotonic()
+            done = self.downloaded >= self.total_size
+            if permille == self.last_permille or (
+                now - self.last_print_ts < PROGRESS_INTERVAL and not done
+            ):
+                return
+
+            _show_download_progress(self.downloaded, self.total_size)
+            self.last_print_ts = now
+            self.last_permille = permille
+            if done or now - self.last_flush_ts >= PROGRESS_FLUSH_INTERVAL:
+                sys.stdout.flush()
+                self.last_flush_ts = now
+
+
+def _open_url(url: str, byte_range: Optional[str] = None):
+    """Open a download URL, optionally requesting a byte range."""
+    from urllib.request import Request
+
+    headers = {"Range": f"bytes={byte_range}"} if byte_range else {}
+    return _opener().open(Request(url, headers=headers), timeout=DOWNLOAD_TIMEOUT)
+
+
+def _probe_download(url: str) -> tuple[str, int, bool]:
+    """Return the final URL, total size and range support for a download."""
+    with _open_url(url, "0-0") as response:
+        final_url = response.geturl()
+        content_range = response.headers.get("Content-Range", "")
+        total = content_range.rpartition("/")[2]
+        if response.status == 206 and total.isdigit():
+            return final_url, int(total), True
+        return final_url, int(response.headers.get("Content-Length", 0)), False
+
+
+def _hash_file(filepath: Path, hasher) -> None:
+    """Feed the current contents of filepath into hasher."""
+    buf = bytearray(CHUNK_SIZE)
+    view = memoryview(buf)
+    with open(filepath, "rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            hasher.update(view[:n])
+
+
+def _download_single(
+    url: str,
+    filepath: Path,
+    progress: _DownloadProgress,
+    resume_from: int = 0,
+    hasher=None,
+) -> None:
+    """Download url into filepath over a single connection.
+
+    When resume_from is set, only the remaining bytes are requested and
+    appended; if the server answers with the full file it is rewritten.
+    If a hasher is given, it is fed every byte of the resulting file.
+    """
+    byte_range = f"{resume_from}-" if resume_from else None
+    with _open_url(url, byte_range) as response:
+        resumed = resume_from and response.status == 206
+        if resumed:
+            content_range = response.headers.get("Content-Range", "")
+            if not content_range.startswith(f"bytes {resume_from}-"):
+                raise OSError(f"Server resumed at the wrong offset ({content_range})")
+            progress.advance(resume_from)
+            if hasher:
+                _hash_file(filepath, hasher)
+
+        with open(filepath, "ab" if resumed else "wb", buffering=CHUNK_SIZE) as f:
+            buf = bytearray(CHUNK_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = response.readinto(buf)
+                if not n:
+                    break
+                f.write(view[:n])
+                if hasher:
+                    hasher.update(view[:n])
+                progress.advance(n)
+
+
+@dataclass
+class _ByteRange:
+    """Inclusive byte range of a download and the next offset to write."""
+
+    start: int
+    end: int
+    written_to: int = 0
+
+
+def _contiguous_prefix(ranges: list[_ByteRange]) -> int:
+    """Return how many leading bytes of the file are completely written."""
+    prefix = 0
+    for byte_range in ranges:
+        prefix = byte_range.written_to
+        if byte_range.written_to <= byte_range.end:
+            break
+    return prefix
+
+
+def _download_range(
+    url: str,
+    fd: int,
+    byte_range: _ByteRange,
+    progress: _DownloadProgress,
+    cancelled: threading.Event,
+) -> None:
+    """Download one byte range of url into fd at the same offset."""
+    start, end = byte_range.start, byte_range.end
+    with _open_url(url, f"{start}-{end}") as response:
+        if response.status != 206:
+            raise OSError(f"Server ignored range request (HTTP {response.status})")
+        buf = bytearray(CHUNK_SIZE)
+        view = memoryview(buf)
+        offset = start
+        while offset <= end and not cancelled.is_set():
+            n = response.readinto(buf)
+            if not n:
+                break
+            written = 0
+            while written < n:
+                written += os.pwrite(fd, view[written:n], offset + written)
+            offset += n
+            byte_range.written_to = offset
+            progress.advance(n)
+
+    if offset != end + 1 and not cancelled.is_set():
+        raise OSError(f"Incomplete download of bytes {start}-{end}")
+
+
+def _download_parallel(
+    url: str,
+    work_path: Path,
+    filepath: Path,
+    total_size: int,
+    progress: _DownloadProgress,
+) -> None:
+    """Download url into filepath as DOWNLOAD_WORKERS concurrent byte ranges.
+
+    The ranges are written into a preallocated work_path, which is only
+    truncated to its fully written prefix and renamed to filepath on exit.
+    A work_path left behind by a killed process is full size but has holes,
+    so it must be discarded rather than resumed.
+    """
+    part_size = -(-total_size // DOWNLOAD_WORKERS)
+    ranges = [
+        _ByteRange(start, min(start + part_size, total_size) - 1, start)
+        for start in range(0, total_size, part_size)
+    ]
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    cancelled = threading.Event()
+
+    fd = os.open(work_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        req = Request(url, headers={"User-Agent": USER_AGENT})
-        with urlopen(req, timeout=DOWNLOAD_TIMEOUT) as response:
-            total_size = int(response.headers.get("Content-Length", 0))
-            downloaded = 0
-
-            with open(filepath, "wb") as f:
-                while True:
-                    chunk = response.read(CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
-
-                    if total_size > 0:
-                        _show_download_progress(downloaded, total_size)
-
-            print()
-            os.chmod(filepath, 0o755)
-            return True
-    except (URLError, HTTPError, TimeoutError, OSError) as e:
+        try:
+            os.posix_fallocate(fd, 0, total_size)
+        except OSError:
+            os.ftruncate(fd, total_size)
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(
+                    _download_range, url, fd, byte_range, progress, cancelled
+                )
+                for byte_range in ranges
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            finally:
+                cancelled.set()
+    finally:
+        try:
+            os.ftruncate(fd, _contiguous_prefix(ranges))
+        finally:
+            os.close(fd)
+        os.replace(work_path, filepath)
+
+
+def download_file(
+    url: str, filepath: Path, expected_sha256: Optional[str] = None
+) -> bool:
+    """Download a file with progress indication.
+
+    Data is written to a ".part" file that is renamed into place once
+    complete. An existing partial file is resumed with a range request;
+    otherwise large files are fetched as parallel range requests when the
+    server supports them, or streamed over a single connection.
+
+    If expected_sha256 is given, the data is hashed as it streams in (which
+    rules out parallel ranges) and discarded on mismatch.
+    """
+    partial_path = filepath.with_name(f"{filepath.name}.part")
+    parallel_path = filepath.with_name(f"{filepath.name}.parallel")
+    hasher = hashlib.sha256() if expected_sha256 else None
+    try:
+        # Leftover from a killed parallel download; its gaps are not resumable
+        parallel_path.unlink(missing_ok=True)
+
+        url, total_size, accepts_ranges = _probe_download(url)
+        progress = _DownloadProgress(total_size)
+
+        resume_from = partial_path.stat().st_size if partial_path.exists() else 0
+        if not accepts_ranges or resume_from > total_size:
+            resume_from = 0
+
+        if resume_from:
+            if resume_from < total_size:
+                print_info(f"Resuming download at {bytes_to_mb(resume_from)}MB")
+                _download_single(url, partial_path, progress, resume_from, hasher)
+            elif hasher:
+                _hash_file(partial_path, hasher)
+        elif (
+            accepts_ranges
+            and not hasher
+            and total_size >= DOWNLOAD_WORKERS * CHUNK_SIZE
+        ):
+            _download_parallel(url, parallel_path, partial_path, total_size, progress)
+        else:
+            _download_single(url, partial_path, progress, hasher=hasher)
+
+        sys.stdout.flush()
+        print()
+        # A connection closed early ends the read loop without an error
+        downloaded = partial_path.stat().st_size
+        if total_size > 0 and downloaded != total_size:
+            print_error(
+                f"Download incomplete ({bytes_to_mb(downloaded)}MB of "
+                f"{bytes_to_mb(total_size)}MB), run the update again to resume"
+            )
+            return False
+
+        if hasher and hasher.hexdigest() != expected_sha256.lower():
+            partial_path.unlink()
+            print_error("Checksum mismatch, download discarded")
+            return False
+
+        os.chmod(partial_path, 0o755)
+        partial_path.replace(filepath)
+        return True
+    except OSError as e:  # includes URLError, HTTPError and timeouts
         print_error(f"Download failed: {e}")
-        if filepath.exists():
-            filepath.unlink()
         return False
 
 
@@ -72,16 +339,15 @@ def download_version(version: str) -> bool:
         print_error(f"Could not get download URL for {version}")
         return False
 
-    DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
-    filepath = get_appimage_path(version)
-
-    if filepath.exists():
+    if version in list_local_appimages():
         print_success("Already downloaded")
         return True
 
+    DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
     print_info(f"⬇️  Downloading {version}...")
-    if not download_file(url, filepath):
+    if not download_file(url, get_appimage_path(version)):
         return False
+    list_local_appimages.cache_clear()
 
     print_success("Download complete")
     return True
@@ -111,58 +377,89 @@ def _remove_case_variants(link: Path) -> None:
                 return  # Only handle one variant
 
 
+def _copy_fast(src: Path, dst: Path) -> None:
+    """Copy an executable file in the kernel with os.sendfile."""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+    except OSError as e:
+        if e.errno not in (errno.EINVAL, errno.ENOSYS):
+            raise
+        import shutil
+
+        shutil.copyfile(src, dst)
+    os.chmod(dst, 0o755)
+
+
 def create_symlink(target: Path, link: Path) -> bool:
-    """Create a symlink, removing existing one if present."""
+    """Create a symlink, atomically replacing an existing one if present."""
     link.parent.mkdir(parents=True, exist_ok=True)
 
     # Remove any existing cursor appimage files with different case
     _remove_case_variants(link)
 
-    # Remove the target link if it exists
-    if link.is_symlink():
-        link.unlink()
-    elif link.exists():
+    # Keep a regular file at the link path as a backup instead of replacing it
+    if link.exists() and not link.is_symlink():
         _backup_existing_file(link)
 
+    # Build the new link beside the old one, then rename it over the old one
+    tmp_link = link.with_name(f"{link.name}.tmp")
     try:
-        link.symlink_to(target)
+        tmp_link.unlink(missing_ok=True)
+        os.symlink(target, tmp_link)
+        os.replace(tmp_link, link)
         return True
     except OSError:
+        pass
+
+    # Filesystems that reject symlinks get a full copy instead
+    try:
+        tmp_link.unlink(missing_ok=True)
+        _copy_fast(target, tmp_link)
+        os.replace(tmp_link, link)
+        return True
+    except OSError:
+        # Don't leave a partial copy of the AppImage behind in ~/.local/bin
+        try:
+            tmp_link.unlink(missing_ok=True)
+        except OSError:
+            pass
         return False
 
 
+def _rewrite_exec_line(match: re.Match) -> str:
+    """Point a desktop file Exec= line at CURSOR_APPIMAGE, keeping its args."""
+    args = match.group(1).split()[1:]
+    return " ".join([f"Exec={CURSOR_APPIMAGE}", *args])
+
+
 def update_desktop_file() -> bool:
     """Update desktop file to point to ~/.local/bin/cursor.AppImage."""
     if not DESKTOP_FILE.exists():
         return False
 
     try:
-        with open(DESKTOP_FILE, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        new_lines = []
-        updated = False
-        for line in lines:
-            if line.startswith("Exec="):
-                parts = line.strip().split()
-                args = " " + " ".join(parts[1:]) if len(parts) > 1 else ""
-                new_lines.append(f"Exec={CURSOR_APPIMAGE}{args}\n")
-                updated = True
-            else:
-                new_lines.append(line)
-
-        if updated:
-            DESKTOP_FILE.write_text("".join(new_lines), encoding="utf-8")
-        return updated
+        content = DESKTOP_FILE.read_text(encoding="utf-8")
+        new_content, count = _EXEC_LINE_RE.subn(_rewrite_exec_line, content)
+        if new_content != content:
+            DESKTOP_FILE.write_text(new_content, encoding="utf-8")
+        return count > 0
     except OSError:
         return False
 
 
 def select_version(version: str, show_success: bool = True) -> bool:
     """Select a version by creating symlink."""
-    appimage_path = get_appimage_path(version)
+    appimage_path = list_local_appimages().get(version)
 
-    if not appimage_path.exists():
+    if not appimage_path:
         print_error(f"Version {version} not found locally")
         return False
 
@@ -8,6 +8,7 @@ from cursor_updater.ui import (
     get_user_choice,
     handle_menu_choice,
 )
+from cursor_updater.version import clear_local_caches
 
 
 def main() -> None:
@@ -15,6 +16,8 @@ def main() -> None:
     DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
 
     while True:
+        # Re-read local state at most once per menu iteration
+        clear_local_caches()
         clear_screen()
         print_header()
         print_menu()
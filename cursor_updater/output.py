@@ -3,16 +3,19 @@
 Everything is bold and gets 2-space indenting by default.
 """
 
+import functools
+
 from cursor_updater.config import BOLD, GREEN, RED, NC
 
 
 def _ensure_indent(message: str) -> str:
     """Ensure message has 2-space indent (if it doesn't already have 2+ spaces)."""
-    if len(message) >= 2 and message[:2] == "  ":
+    if message.startswith("  "):
         return message
     return f"  {message.lstrip()}"
 
 
+@functools.lru_cache(maxsize=256)
 def format_message(message: str, color: str = "") -> str:
     """Format message: always bold, always 2-space indent."""
     return f"{BOLD}{color}{_ensure_indent(message)}{NC}"
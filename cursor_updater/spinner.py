@@ -65,14 +65,14 @@ class Spinner:
         self.stop_event = threading.Event()
         self.thread: Optional[threading.Thread] = None
         self.frame_index = 0
+        self._rendered: list[str] = []
 
     def _animate(self) -> None:
         """Animate the spinner in a separate thread."""
+        rendered = self._rendered
         while not self.stop_event.is_set():
-            frame = FRAMES[self.frame_index]
-            self.frame_index = (self.frame_index + 1) % len(FRAMES)
-            text = _format_spinner_text(frame, self.message)
-            self.stream.write(f"\r{_format_ansi_text(text)}")
+            self.stream.write(rendered[self.frame_index])
+            self.frame_index = (self.frame_index + 1) % len(rendered)
             self.stream.flush()
             self.stop_event.wait(FRAME_INTERVAL)
 
@@ -86,6 +86,10 @@ class Spinner:
         """Start spinner animation and disable input."""
         if self.thread and self.thread.is_alive():
             return
+        self._rendered = [
+            f"\r{_format_ansi_text(_format_spinner_text(frame, self.message))}"
+            for frame in FRAMES
+        ]
         self.stop_event.clear()
         self.thread = threading.Thread(target=self._animate, daemon=True)
         self.thread.start()
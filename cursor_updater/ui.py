@@ -1,10 +1,11 @@
 """User interface components for Cursor Updater."""
 
 import os
+import select
 import sys
 import termios
 import tty
-from pathlib import Path
+from contextlib import contextmanager
 
 from cursor_updater.config import (
     BOLD_BLUE,
@@ -19,9 +20,12 @@ from cursor_updater.config import (
     PREFIX_WIDTH,
     NC,
     BOLD,
+    CLEAR_SCREEN,
 )
 from cursor_updater.version import (
+    LaunchInfo,
     VersionInfo,
+    clear_caches,
     get_version_status,
     get_latest_remote_version,
     get_latest_local_version,
@@ -33,54 +37,80 @@ from cursor_updater.output import (
     format_unindented,
     print_error,
     print_success,
-    print_bold,
 )
 from cursor_updater.spinner import show_spinner
 
+_HEADER_ART = [
+    "      ▄▖▖▖▄▖▄▖▄▖▄▖  ▖▖▄▖▄ ▄▖▄▖▄▖▄▖",
+    "      ▌ ▌▌▙▘▚ ▌▌▙▘  ▌▌▙▌▌▌▌▌▐ ▙▖▙▘",
+    "      ▙▖▙▌▌▌▄▌▙▌▌▌  ▙▌▌ ▙▘▛▌▐ ▙▖▌▌",
+]
 
-def getch() -> str:
-    """Read a single character from stdin without requiring Enter."""
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
+# The header is static, so it is formatted once at import
+_HEADER_TEXT = "\n{}\n\n".format(
+    "\n".join(format_unindented(line, BOLD_BLUE) for line in _HEADER_ART)
+)
+
+_CLEAR_LINE = "\r" + " " * 60 + "\r"
+_ESC_CHR = chr(ESC_KEY)
+_VALID_CHOICES = frozenset([*MENU_OPTIONS, "q"])
+
+# Terminal attributes saved by _termios_settings, keyed by file descriptor
+_CACHED_TERMIOS: dict[int, tuple[list, list]] = {}
+
+
+def _termios_settings(fd: int) -> tuple[list, list]:
+    """Return the (original, raw) terminal attributes for fd, cached per fd."""
+    if fd not in _CACHED_TERMIOS:
+        original = termios.tcgetattr(fd)
+        tty.setraw(fd)
+        raw = termios.tcgetattr(fd)
+        termios.tcsetattr(fd, termios.TCSADRAIN, original)
+        _CACHED_TERMIOS[fd] = (original, raw)
+    return _CACHED_TERMIOS[fd]
+
+
+@contextmanager
+def _raw_mode(fd: int):
+    """Put the terminal in raw mode for the duration of the block."""
+    old_settings, raw_settings = _termios_settings(fd)
+    termios.tcsetattr(fd, termios.TCSADRAIN, raw_settings)
     try:
-        tty.setraw(sys.stdin.fileno())
-        return sys.stdin.read(1)
+        yield
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 
-def getch_timeout(timeout: float = 0.1) -> str:
-    """Read a single character with timeout. Returns empty string if timeout."""
+def _read_char(fd: int) -> str:
+    """Read one byte straight from the terminal, bypassing stdin buffering."""
+    return os.read(fd, 1).decode("utf-8", "replace")
+
+
+def getch() -> str:
+    """Read a single character from stdin without requiring Enter."""
     fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(sys.stdin.fileno())
-        new_settings = termios.tcgetattr(fd)
-        new_settings[6][termios.VMIN] = 0
-        new_settings[6][termios.VTIME] = int(timeout * 10)
-        termios.tcsetattr(fd, termios.TCSADRAIN, new_settings)
-        char = sys.stdin.read(1)
-        return char if char else ""
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    with _raw_mode(fd):
+        return _read_char(fd)
 
 
 def clear_screen() -> None:
     """Clear the terminal screen."""
-    os.system("clear" if os.name != "nt" else "cls")
+    if os.name == "nt":
+        os.system("cls")
+        return
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write lines to stdout in a single call and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def print_header() -> None:
     """Print the application header."""
-    print()
-    header_art = [
-        "      ▄▖▖▖▄▖▄▖▄▖▄▖  ▖▖▄▖▄ ▄▖▄▖▄▖▄▖",
-        "      ▌ ▌▌▙▘▚ ▌▌▙▘  ▌▌▙▌▌▌▌▌▐ ▙▖▙▘",
-        "      ▙▖▙▌▌▌▄▌▙▌▌▌  ▙▌▌ ▙▘▛▌▐ ▙▖▌▌",
-    ]
-    for line in header_art:
-        print(format_unindented(line, BOLD_BLUE))
-    print()
+    sys.stdout.write(_HEADER_TEXT)
 
 
 def draw_box_top(width: int) -> str:
@@ -93,29 +123,27 @@ def draw_box_bottom(width: int) -> str:
     return "╚" + "═" * (width - 2) + "╝"
 
 
-def _print_menu_line(line: str, width: int) -> None:
-    """Print a single menu line with borders, centered."""
-    total_padding = width - len(line) - 2  # -2 for borders
-    left_padding = 1
-    right_padding = total_padding - left_padding
+def _format_menu_line(line: str, width: int) -> str:
+    """Format a single menu line with borders, padded to the box width."""
+    border = format_unindented("║", BOLD_BLUE)
+    body = f" {line}".ljust(width - 2)  # -2 for borders
+    return f"{border}{BOLD}{body}{NC}{border}"
 
-    print(format_unindented("║", BOLD_BLUE), end="")
-    print(f"{BOLD}{' ' * left_padding}{line}{' ' * right_padding}{NC}", end="")
-    print(format_unindented("║", BOLD_BLUE))
+
+# The menu is static, so its box is laid out once at import
+_MENU_LINES = [f"  {key}. {description}" for key, description in MENU_OPTIONS.items()]
+_MENU_WIDTH = max(len(line) for line in _MENU_LINES) + 8
+_MENU_BOX = [
+    format_unindented(draw_box_top(_MENU_WIDTH), BOLD_BLUE),
+    *(_format_menu_line(line, _MENU_WIDTH) for line in _MENU_LINES),
+    format_unindented(draw_box_bottom(_MENU_WIDTH), BOLD_BLUE),
+    "",
+]
 
 
 def print_menu() -> None:
     """Print the main menu with retro pixel borders."""
-    menu_lines = [
-        f"  {key}. {description}" for key, description in MENU_OPTIONS.items()
-    ]
-    width = max(len(line) for line in menu_lines) + 8
-
-    print(format_unindented(draw_box_top(width), BOLD_BLUE))
-    for line in menu_lines:
-        _print_menu_line(line, width)
-    print(format_unindented(draw_box_bottom(width), BOLD_BLUE))
-    print()
+    _write_lines(_MENU_BOX)
 
 
 def wait_for_key(message: str = MSG_WAIT_KEY) -> None:
@@ -130,96 +158,100 @@ def exit_app(message: str = MSG_EXITING) -> None:
     sys.exit(0)
 
 
-def _print_info_line(label: str, value: str) -> None:
-    """Print a formatted info line with consistent spacing."""
-    print(format_message(f"{label:<{PREFIX_WIDTH}} {value}"))
+def _format_info_line(label: str, value: str) -> str:
+    """Format an info line with consistent spacing."""
+    return format_message(f"{label.ljust(PREFIX_WIDTH)} {value}")
 
 
 def print_version_info(info: VersionInfo) -> None:
     """Print version information."""
-    print()
-    print(format_message("Cursor App Information:"))
+    lines = ["", format_message("Cursor App Information:")]
 
     if not info.latest_remote:
-        _print_info_line("  - 📡 Latest remote version:", "(unavailable)")
-        return
+        lines.append(
+            _format_info_line("  - 📡 Latest remote version:", "(unavailable)")
+        )
+    else:
+        lines += [
+            _format_info_line("  - 📡 Latest remote version:", info.latest_remote),
+            _format_info_line(
+                "  - 📂 Latest locally available:", info.latest_local or "None"
+            ),
+            _format_info_line("  - ⚡ Currently active:", info.local or "None"),
+        ]
 
-    _print_info_line("  - 📡 Latest remote version:", info.latest_remote)
-    _print_info_line("  - 📂 Latest locally available:", info.latest_local or "None")
-    _print_info_line("  - ⚡ Currently active:", info.local or "None")
+    _write_lines(lines)
 
 
-def _print_label_value(label: str, value: str) -> None:
-    """Print a label and value on separate lines with proper indentation."""
-    print(format_message(label))
-    print(format_message(f"    {value.lstrip()}"))
+def _format_label_value(label: str, value: str) -> list[str]:
+    """Format a label and value on separate lines with proper indentation."""
+    return [format_message(label), format_message(f"    {value.lstrip()}")]
 
 
-def _print_warnings_and_tips(launch_info: dict) -> None:
-    """Print warnings and tips based on launch configuration."""
-    running_path = launch_info.get("running_from")
-    desktop_path = launch_info.get("desktop_file_exec")
+def _format_warnings_and_tips(launch_info: LaunchInfo) -> list[str]:
+    """Format warnings and tips based on launch configuration."""
+    lines = []
+    # Both paths arrive fully resolved from get_launch_info
+    running_path = launch_info.running_from
+    desktop_target = launch_info.desktop_file_target
 
-    if running_path and desktop_path:
-        if Path(running_path).resolve() != Path(desktop_path).resolve():
-            print(
+    if running_path and desktop_target:
+        if running_path != desktop_target:
+            lines += [
                 format_message(
                     "⚠️  Warning: Running instance and desktop launcher point to different locations",
                     YELLOW,
-                )
-            )
-            print(
+                ),
                 format_message(
                     "   Restart Cursor to use the version specified in the desktop launcher."
-                )
-            )
-            print()
+                ),
+                "",
+            ]
 
-    if not launch_info["in_path"]:
-        print(
+    if not launch_info.in_path:
+        lines += [
             format_message(
                 "💡 Tip: Add ~/.local/bin to your PATH for command-line access", YELLOW
-            )
-        )
-        print()
+            ),
+            "",
+        ]
+
+    return lines
 
 
 def print_launch_info() -> None:
     """Print information about how Cursor is launched."""
     launch_info = get_launch_info()
 
-    print()
-    print(format_message("Launch Configuration:", BOLD_BLUE))
-    print()
+    lines = ["", format_message("Launch Configuration:", BOLD_BLUE), ""]
 
-    print(format_message("  Runtime:"))
-    _print_label_value(
-        "  - 🚀 Running from:", launch_info.get("running_from") or "(not running)"
+    lines.append(format_message("  Runtime:"))
+    lines += _format_label_value(
+        "  - 🚀 Running from:", launch_info.running_from or "(not running)"
     )
-    print()
+    lines.append("")
 
-    print(format_message("  Configuration:"))
-    _print_label_value(
+    lines.append(format_message("  Configuration:"))
+    lines += _format_label_value(
         "  - 🖥️  Desktop launcher:",
-        launch_info.get("desktop_file_exec") or "(not found)",
+        launch_info.desktop_file_exec or "(not found)",
     )
 
-    if launch_info["symlink_exists"]:
-        symlink_path = launch_info.get("symlink_path") or str(CURSOR_APPIMAGE)
-        symlink_value = (
-            launch_info.get("symlink_target") or f"{symlink_path} (regular file)"
-        )
+    if launch_info.symlink_exists:
+        symlink_path = launch_info.symlink_path or str(CURSOR_APPIMAGE)
+        symlink_value = launch_info.symlink_target or f"{symlink_path} (regular file)"
     else:
         symlink_value = f"{CURSOR_APPIMAGE} (does not exist)"
-    _print_label_value("  - 🔗 Symlink:", symlink_value)
-    print()
+    lines += _format_label_value("  - 🔗 Symlink:", symlink_value)
+    lines.append("")
 
-    print(format_message("  Environment:"))
-    path_status = "✅ Yes" if launch_info["in_path"] else "❌ No"
-    print(format_message(f"  - 📍 ~/.local/bin in PATH: {path_status}"))
-    print()
+    lines.append(format_message("  Environment:"))
+    path_status = "✅ Yes" if launch_info.in_path else "❌ No"
+    lines.append(format_message(f"  - 📍 ~/.local/bin in PATH: {path_status}"))
+    lines.append("")
 
-    _print_warnings_and_tips(launch_info)
+    lines += _format_warnings_and_tips(launch_info)
+    _write_lines(lines)
 
 
 def get_update_status_message(info: VersionInfo) -> str:
@@ -230,14 +262,10 @@ def get_update_status_message(info: VersionInfo) -> str:
         )
 
     if info.latest_remote != info.latest_local:
-        message = format_message(
-            f"🔍 There is a newer Cursor version available for download: {info.latest_remote}",
-            YELLOW,
-        )
+        message = f"🔍 There is a newer Cursor version available for download: {info.latest_remote}"
         if info.latest_local:
-            local_note = f"   (You have {info.latest_local} locally, you can update to the latest version by pressing 2)"
-            message += f"\n{format_message(local_note)}"
-        return message
+            message += f"\n   (You have {info.latest_local} locally, you can update to the latest version by pressing 2)"
+        return format_message(message, YELLOW)
 
     if info.latest_remote != info.local:
         return format_message(
@@ -263,6 +291,7 @@ def check_versions() -> None:
 
 def update_cursor() -> bool:
     """Update Cursor to latest version."""
+    # Version history is kept in memory, so a preceding check is not refetched
     with show_spinner("Checking for updates"):
         latest_remote = get_latest_remote_version()
 
@@ -270,6 +299,7 @@ def update_cursor() -> bool:
         print_error("Could not determine latest version")
         return False
 
+    # Local state is re-read, since downloads may have changed since the check
     with show_spinner("Checking local versions"):
         latest_local = get_latest_local_version()
 
@@ -281,6 +311,7 @@ def update_cursor() -> bool:
         success = select_version(latest_remote, show_success=False)
 
     if success:
+        clear_caches()
         print_success(
             f"{latest_remote} is now active. Please restart Cursor to use the new version."
         )
@@ -288,84 +319,107 @@ def update_cursor() -> bool:
     return success
 
 
+# Help screen content is static, so it is formatted once at import
+_HELP_LINES = [
+    "",
+    format_message("📖 Help & Information", BOLD_BLUE),
+    "",
+    "",
+    format_message("Menu Options:"),
+    "",
+    format_message("1. Check Current Setup Information"),
+    format_message("   - Shows version info (current, latest local, latest remote)"),
+    format_message("   - Displays launch configuration and update status"),
+    "",
+    format_message("2. Update Cursor to latest version"),
+    format_message("   - Downloads latest version if needed"),
+    format_message("   - Updates symlink and desktop launcher"),
+    format_message("   - Restart Cursor manually to use the new version"),
+    "",
+    format_message("3. Help"),
+    format_message("   - Shows this help information"),
+    "",
+    format_message("4. Exit"),
+    format_message("   - Exits the application"),
+    "",
+    format_message("How it works:"),
+    "",
+    format_message(f"• Active installation: {CURSOR_APPIMAGE}"),
+    format_message(f"• Downloads stored in: {DOWNLOADS_DIR}"),
+    format_message("• Uses symlinks to manage versions efficiently"),
+    format_message("• Version cache: 15 minutes (auto-refreshes)"),
+    "",
+    format_message("Tips:"),
+    "",
+    format_message("• Press ESC to exit anytime"),
+    format_message("• Ensure ~/.local/bin is in your PATH for command-line access"),
+    format_message(
+        "• Desktop launcher is automatically updated to use managed version"
+    ),
+    "",
+]
+
+
 def show_help() -> None:
     """Display help information."""
-    print()
-    print(format_message("📖 Help & Information", BOLD_BLUE))
-    print()
-    print()
-
-    print(format_message("Menu Options:"))
-    print()
-    print_bold("1. Check Current Setup Information")
-    print_bold("   - Shows version info (current, latest local, latest remote)")
-    print_bold("   - Displays launch configuration and update status")
-    print()
-    print_bold("2. Update Cursor to latest version")
-    print_bold("   - Downloads latest version if needed")
-    print_bold("   - Updates symlink and desktop launcher")
-    print_bold("   - Restart Cursor manually to use the new version")
-    print()
-    print_bold("3. Help")
-    print_bold("   - Shows this help information")
-    print()
-    print_bold("4. Exit")
-    print_bold("   - Exits the application")
-    print()
-
-    print(format_message("How it works:"))
-    print()
-    print_bold(f"• Active installation: {CURSOR_APPIMAGE}")
-    print_bold(f"• Downloads stored in: {DOWNLOADS_DIR}")
-    print_bold("• Uses symlinks to manage versions efficiently")
-    print_bold("• Version cache: 15 minutes (auto-refreshes)")
-    print()
-
-    print(format_message("Tips:"))
-    print()
-    print_bold("• Press ESC to exit anytime")
-    print_bold("• Ensure ~/.local/bin is in your PATH for command-line access")
-    print_bold("• Desktop launcher is automatically updated to use managed version")
-    print()
+    _write_lines(_HELP_LINES)
+
+
+_MENU_ACTIONS = {
+    "1": check_versions,
+    "2": update_cursor,
+    "3": show_help,
+}
+_EXIT_CHOICES = frozenset({"4", "q"})
 
 
 def handle_menu_choice(choice: str) -> None:
     """Handle user menu choice."""
-    menu_actions = {
-        "1": check_versions,
-        "2": update_cursor,
-        "3": show_help,
-    }
+    if choice in _EXIT_CHOICES:
+        exit_app()
 
-    if choice in menu_actions:
+    action = _MENU_ACTIONS.get(choice)
+    if action:
         print()
-        menu_actions[choice]()
+        action()
         print()
         wait_for_key()
-    elif choice in ("q", "4"):
-        exit_app()
+
+
+def _clear_prompt_line() -> None:
+    """Blank out the prompt line so it can be redrawn."""
+    sys.stdout.write(_CLEAR_LINE)
+    sys.stdout.flush()
 
 
 def get_user_choice() -> str:
     """Get user menu choice."""
+    fd = sys.stdin.fileno()
     while True:
         print(format_message("  Press [1-4] to select: "), end="", flush=True)
-        choice = getch()
 
-        if ord(choice) == ESC_KEY:
-            next_char = getch_timeout(0.15)
-            if not next_char:
+        # Stay in raw mode while reading a key and any escape sequence after it
+        with _raw_mode(fd):
+            choice = _read_char(fd)
+            lone_esc = False
+            if choice == _ESC_CHR:
+                ready, _, _ = select.select([fd], [], [], 0.15)
+                lone_esc = not ready
+                if ready:
+                    os.read(fd, 32)  # drain the rest of the escape sequence
+
+        if not choice:  # stdin closed
+            exit_app()
+
+        if choice == _ESC_CHR:
+            if lone_esc:
                 exit_app()
-            while True:
-                char = getch_timeout(0.05)
-                if not char:
-                    break
-            print("\r" + " " * 60 + "\r", end="", flush=True)
+            _clear_prompt_line()
             continue
 
         choice = choice.strip().lower()
-        if choice in ("1", "2", "3", "4", "q"):
+        if choice in _VALID_CHOICES:
             print(choice)
             return choice
 
-        print("\r" + " " * 60 + "\r", end="", flush=True)
+        _clear_prompt_line()
@@ -1,22 +1,23 @@
 """Version management and caching for Cursor Updater."""
 
+import fnmatch
+import functools
 import json
 import os
 import platform
 import re
-import shutil
-import subprocess
-import tempfile
+import sys
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
 
 from cursor_updater.config import (
     CACHE_FILE,
+    APPIMAGE_VERSION_CACHE_FILE,
     CACHE_MAX_AGE,
+    STATUS_CACHE_MAX_AGE,
     VERSION_HISTORY_URL,
     REQUEST_TIMEOUT,
     USER_AGENT,
@@ -29,6 +30,21 @@ from cursor_updater.config import (
 )
 from cursor_updater.spinner import show_spinner
 
+# Name patterns compiled once; directory scans match entries in Python
+_APPIMAGE_NAME_RES = [
+    re.compile(fnmatch.translate(pattern)) for pattern in CURSOR_APPIMAGE_PATTERNS
+]
+_VERSIONED_NAME_RE = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in CURSOR_VERSIONED_PATTERNS)
+)
+
+# Byte markers for versions embedded in an AppImage, with the pattern that
+# reads the value right after each one
+_EMBEDDED_VERSION_MARKERS = [
+    (b'"version"', re.compile(rb'"version"\s*:\s*"([0-9.]+)"')),
+    (b"X-AppImage-Version=", re.compile(rb"X-AppImage-Version=[ \t]*([!-~]+)")),
+]
+
 
 @dataclass
 class VersionInfo:
@@ -39,6 +55,41 @@ class VersionInfo:
     latest_remote: Optional[str] = None
 
 
+@dataclass
+class LaunchInfo:
+    """Container for how Cursor is launched."""
+
+    running_from: Optional[str] = None
+    desktop_file_exec: Optional[str] = None
+    desktop_file_target: Optional[str] = None
+    symlink_target: Optional[str] = None
+    symlink_exists: bool = False
+    symlink_path: Optional[str] = None
+    in_path: bool = False
+
+
+def _ttl_cache(max_age: float):
+    """Cache a no-argument function's non-None result for max_age seconds."""
+
+    def decorator(func):
+        cached: list = []  # [timestamp, value] once populated
+
+        @functools.wraps(func)
+        def wrapper():
+            if cached and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+            value = func()
+            if value is not None:
+                cached[:] = [time.monotonic(), value]
+            return value
+
+        wrapper.cache_clear = cached.clear
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=1)
 def get_platform() -> str:
     """Detect platform architecture."""
     arch = platform.machine()
@@ -56,6 +107,7 @@ def extract_version_from_filename(filename: str) -> Optional[str]:
     return match.group(1) if match else None
 
 
+@functools.lru_cache(maxsize=256)
 def parse_version_tuple(version: str) -> Optional[tuple]:
     """Convert version string to tuple for comparison."""
     try:
@@ -64,61 +116,171 @@ def parse_version_tuple(version: str) -> Optional[tuple]:
         return None
 
 
+def _version_sort_key(version: str) -> tuple:
+    """Sort key that places unparseable versions last."""
+    return parse_version_tuple(version) or (-1,)
+
+
 def sort_versions(versions: list[str]) -> list[str]:
     """Sort versions in descending order."""
-    return sorted(versions, key=parse_version_tuple, reverse=True)
+    return sorted(versions, key=_version_sort_key, reverse=True)
 
 
 class VersionHistoryCache:
-    """Manages version history caching."""
+    """Manages version history caching.
 
-    @staticmethod
-    def is_cache_valid() -> bool:
-        """Check if cache exists and is still valid."""
-        if not CACHE_FILE.exists():
-            return False
-        cache_age = time.time() - CACHE_FILE.stat().st_mtime
-        return cache_age < CACHE_MAX_AGE
+    The cache file holds {"headers": {...}, "data": {...}}, where headers are
+    the ETag/Last-Modified validators of the response the data came from.
+    """
 
     @staticmethod
-    def load() -> Optional[dict]:
-        """Load version history from cache."""
-        if not VersionHistoryCache.is_cache_valid():
-            return None
+    def _load_entry(
+        max_age: Optional[float] = None,
+    ) -> Optional[tuple[dict, float]]:
+        """Load the cache file and its mtime if younger than max_age.
+
+        Files in the older bare-data format are returned with empty headers.
+        """
         try:
-            with open(CACHE_FILE, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
+            with open(CACHE_FILE, "rb") as f:
+                # fstat the open file: one open, no separate exists/stat calls
+                mtime = os.fstat(f.fileno()).st_mtime
+                if max_age is not None and time.time() - mtime >= max_age:
+                    return None
+                entry = json.load(f)
+        except (ValueError, OSError):
             return None
+        if "data" not in entry:
+            entry = {"headers": {}, "data": entry}
+        return entry, mtime
 
     @staticmethod
-    def save(data: dict) -> None:
+    def load() -> Optional[tuple[dict, float]]:
+        """Load fresh version history from cache, with the time it was saved."""
+        loaded = VersionHistoryCache._load_entry(CACHE_MAX_AGE)
+        if not loaded:
+            return None
+        entry, mtime = loaded
+        return entry["data"], mtime
+
+    @staticmethod
+    def save(data: dict, headers: Optional[dict] = None) -> None:
         """Save version history to cache."""
         try:
             with open(CACHE_FILE, "w") as f:
-                json.dump(data, f)
+                json.dump({"headers": headers or {}, "data": data}, f)
         except OSError:
             pass
 
     @staticmethod
     def load_stale() -> Optional[dict]:
         """Load stale cache as fallback."""
-        if not CACHE_FILE.exists():
-            return None
+        loaded = VersionHistoryCache._load_entry()
+        return loaded[0]["data"] if loaded else None
+
+    @staticmethod
+    def load_headers() -> dict:
+        """Load the validators stored with the cached data."""
+        loaded = VersionHistoryCache._load_entry()
+        return loaded[0]["headers"] if loaded else {}
+
+    @staticmethod
+    def touch() -> None:
+        """Mark the cached data as fresh again."""
         try:
-            with open(CACHE_FILE, "r") as f:
+            os.utime(CACHE_FILE)
+        except OSError:
+            pass
+
+
+class AppImageVersionCache:
+    """Remembers versions read from AppImages, keyed by path, mtime and size."""
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _load_all() -> dict:
+        """Load every cached entry."""
+        try:
+            with open(APPIMAGE_VERSION_CACHE_FILE, "r") as f:
                 return json.load(f)
         except (json.JSONDecodeError, OSError):
-            return None
+            return {}
+
+    @staticmethod
+    def load(appimage_path: Path, stat: os.stat_result) -> Optional[str]:
+        """Return the cached version if the file is unchanged since it was read."""
+        entry = AppImageVersionCache._load_all().get(str(appimage_path))
+        if entry and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return entry[2]
+        return None
+
+    @staticmethod
+    def save(appimage_path: Path, stat: os.stat_result, version: str) -> None:
+        """Record the version read from an AppImage."""
+        tmp_file = APPIMAGE_VERSION_CACHE_FILE.with_name(
+            f"{APPIMAGE_VERSION_CACHE_FILE.name}.{os.getpid()}.tmp"
+        )
+        with AppImageVersionCache._lock:
+            entries = AppImageVersionCache._load_all()
+            entries[str(appimage_path)] = [stat.st_mtime_ns, stat.st_size, version]
+            try:
+                with open(tmp_file, "w") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_file, APPIMAGE_VERSION_CACHE_FILE)
+            except OSError:
+                pass
+
+
+def _slim_version_history(data: dict) -> dict:
+    """Keep only the current platform's download URLs from version history."""
+    platform_name = get_platform()
+    versions = []
+    for v in data.get("versions", []):
+        url = v.get("platforms", {}).get(platform_name)
+        if url and "version" in v:
+            versions.append(
+                {"version": v["version"], "platforms": {platform_name: url}}
+            )
+    return {"versions": versions}
 
 
 def fetch_version_history() -> Optional[dict]:
-    """Fetch version history from remote URL."""
+    """Fetch version history from remote URL and update the cache."""
+    import gzip
+    from urllib.error import HTTPError, URLError
+    from urllib.request import Request, urlopen
+
+    headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+    # Revalidate the cached copy so an unchanged file costs a 304, not a body
+    validators = VersionHistoryCache.load_headers()
+    if etag := validators.get("ETag"):
+        headers["If-None-Match"] = etag
+    if last_modified := validators.get("Last-Modified"):
+        headers["If-Modified-Since"] = last_modified
+
     try:
-        req = Request(VERSION_HISTORY_URL, headers={"User-Agent": USER_AGENT})
+        req = Request(VERSION_HISTORY_URL, headers=headers)
         with urlopen(req, timeout=REQUEST_TIMEOUT) as response:
-            return json.loads(response.read().decode())
-    except (URLError, HTTPError, json.JSONDecodeError, TimeoutError):
+            body = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            data = _slim_version_history(json.loads(body))
+            VersionHistoryCache.save(
+                data,
+                {
+                    name: value
+                    for name in ("ETag", "Last-Modified")
+                    if (value := response.headers.get(name))
+                },
+            )
+            return data
+    except HTTPError as e:
+        if e.code == 304:
+            VersionHistoryCache.touch()
+            return VersionHistoryCache.load_stale()
+        return None
+    except (URLError, json.JSONDecodeError, TimeoutError, OSError, EOFError):
         return None
 
 
@@ -128,18 +290,29 @@ def _fetch_version_history_with_spinner() -> Optional[dict]:
         return fetch_version_history()
 
 
+# Fresh version history kept in memory: [expires_at, data] once populated
+_FRESH_HISTORY: list = []
+
+
 def get_version_history() -> Optional[dict]:
-    """Get version history from cache or remote."""
+    """Get version history from memory, cache or remote.
+
+    Only fresh data is kept in memory, until CACHE_MAX_AGE after it was
+    fetched; a stale fallback is returned but retried on the next call.
+    """
+    if _FRESH_HISTORY and time.time() < _FRESH_HISTORY[0]:
+        return _FRESH_HISTORY[1]
+
     cached = VersionHistoryCache.load()
     if cached:
-        return cached
-
-    data = _fetch_version_history_with_spinner()
-    if data:
-        VersionHistoryCache.save(data)
-        return data
+        data, fetched_at = cached
+    else:
+        data, fetched_at = _fetch_version_history_with_spinner(), time.time()
+        if not data:
+            return VersionHistoryCache.load_stale()
 
-    return VersionHistoryCache.load_stale()
+    _FRESH_HISTORY[:] = [fetched_at + CACHE_MAX_AGE, data]
+    return data
 
 
 def get_platform_versions(version_history: dict) -> list[str]:
@@ -167,8 +340,15 @@ def get_latest_remote_version() -> Optional[str]:
     return sort_versions(platform_versions)[0]
 
 
+# Download URLs already found, by version (misses are not cached)
+_DOWNLOAD_URLS: dict[str, str] = {}
+
+
 def get_download_url(version: str) -> Optional[str]:
     """Get download URL for a specific version."""
+    if version in _DOWNLOAD_URLS:
+        return _DOWNLOAD_URLS[version]
+
     version_history = get_version_history()
     if not version_history:
         return None
@@ -180,6 +360,7 @@ def get_download_url(version: str) -> Optional[str]:
             if v.get("version") == version:
                 url = v.get("platforms", {}).get(platform_name)
                 if url:
+                    _DOWNLOAD_URLS[version] = url
                     return url
     except (KeyError, ValueError):
         pass
@@ -187,77 +368,110 @@ def get_download_url(version: str) -> Optional[str]:
     return None
 
 
-def _find_appimage_path_in_line(line: str) -> Optional[Path]:
-    """Extract AppImage path from a process line."""
-    matches = re.findall(r"(/[^\s]+cursor[^\s]*\.AppImage)", line)
-    for match in matches:
-        path = Path(match)
+def _extract_appimage_token(argv_bytes: bytes, sep: bytes = b"\0") -> Optional[Path]:
+    """Extract a Cursor AppImage path from a process command line."""
+    for token in argv_bytes.split(sep):
+        end = token.find(b".AppImage")
+        if end == -1 or b"cursor" not in token.lower():
+            continue
+        start = max(token.find(b"/"), 0)
+        path = Path(os.fsdecode(token[start : end + len(b".AppImage")]))
         if path.exists():
             return path.resolve()
+    return None
+
 
-    parts = line.split()
-    for part in parts:
-        if part.endswith(".AppImage") and "cursor" in part.lower():
-            path = Path(part)
-            if path.exists():
-                return path.resolve()
+def _scan_proc_for_cursor() -> Optional[Path]:
+    """Find a running Cursor AppImage by reading /proc/<pid>/cmdline."""
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    argv_bytes = f.read()
+            except OSError:
+                continue  # Process exited or is not readable
+            if b".AppImage" in argv_bytes:
+                if path := _extract_appimage_token(argv_bytes):
+                    return path
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_running_cursor_path() -> Optional[Path]:
     """Find the path to the currently running Cursor executable from process list."""
+    if sys.platform.startswith("linux"):
+        try:
+            return _scan_proc_for_cursor()
+        except OSError:
+            return None
+
+    import subprocess
+
     try:
         result = subprocess.run(
             ["ps", "aux"],
             capture_output=True,
-            text=True,
             timeout=2,
         )
         for line in result.stdout.splitlines():
-            if "cursor" in line.lower() and ".AppImage" in line:
-                if path := _find_appimage_path_in_line(line):
+            if b".AppImage" in line:
+                if path := _extract_appimage_token(line, sep=b" "):
                     return path
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
         pass
     return None
 
 
-def extract_version_from_appimage(appimage_path: Path) -> Optional[str]:
-    """Extract version from AppImage file (package.json, desktop file, or filename)."""
+def _read_version_from_extract(extract_dir: Path) -> Optional[str]:
+    """Read the version from an extracted AppImage tree."""
+    for package_json_path in extract_dir.glob("**/resources/app/package.json"):
+        try:
+            with open(package_json_path, "r", encoding="utf-8") as f:
+                package_data = json.load(f)
+                if version := package_data.get("version"):
+                    return version
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            continue
+
+    for desktop_file in extract_dir.glob("**/*.desktop"):
+        try:
+            with open(desktop_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith("X-AppImage-Version="):
+                        version = line.split("=", 1)[1].strip()
+                        if version:
+                            return version
+        except (OSError, UnicodeDecodeError):
+            continue
+    return None
+
+
+def _extract_version_with_pattern(
+    appimage_path: Path, pattern: Optional[str] = None
+) -> Optional[str]:
+    """Extract (part of) an AppImage into a temp dir and read its version."""
+    import shutil
+    import subprocess
+    import tempfile
+
     extract_dir = None
+    command = [str(appimage_path), "--appimage-extract"]
+    if pattern:
+        command.append(pattern)
     try:
         extract_dir = Path(tempfile.mkdtemp(prefix="cursor_version_"))
         result = subprocess.run(
-            [str(appimage_path), "--appimage-extract"],
+            command,
             cwd=str(extract_dir),
             capture_output=True,
             text=True,
             timeout=30,
         )
-
         if result.returncode == 0:
-            package_json_paths = list(extract_dir.glob("**/resources/app/package.json"))
-            for package_json_path in package_json_paths:
-                try:
-                    with open(package_json_path, "r", encoding="utf-8") as f:
-                        package_data = json.load(f)
-                        if version := package_data.get("version"):
-                            return version
-                except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-                    continue
-
-            desktop_files = list(extract_dir.glob("**/*.desktop"))
-            for desktop_file in desktop_files:
-                try:
-                    with open(desktop_file, "r", encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            if line.startswith("X-AppImage-Version="):
-                                version = line.split("=", 1)[1].strip()
-                                if version:
-                                    return version
-                except (OSError, UnicodeDecodeError):
-                    continue
+            return _read_version_from_extract(extract_dir)
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
         pass
     finally:
@@ -266,81 +480,161 @@ def extract_version_from_appimage(appimage_path: Path) -> Optional[str]:
                 shutil.rmtree(extract_dir)
             except OSError:
                 pass
+    return None
+
+
+def _find_embedded_version(data) -> Optional[str]:
+    """Find the earliest version marker in raw AppImage bytes."""
+    found = []
+    for marker, pattern in _EMBEDDED_VERSION_MARKERS:
+        pos = data.find(marker)
+        while pos != -1:
+            if match := pattern.match(data, pos, pos + 64):
+                found.append((pos, match.group(1)))
+                break
+            pos = data.find(marker, pos + 1)
+    return min(found)[1].decode("ascii") if found else None
+
+
+def _read_appimage_version(appimage_path: Path) -> Optional[str]:
+    """Read the version embedded in an AppImage (package.json or desktop file)."""
+    # Unpack only package.json first; a full extraction writes the whole image
+    version = _extract_version_with_pattern(
+        appimage_path, "*resources/app/package.json"
+    ) or _extract_version_with_pattern(appimage_path)
+    if version:
+        return version
+
+    import mmap
 
     try:
-        result = subprocess.run(
-            ["strings", str(appimage_path)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        for line in result.stdout.splitlines():
-            if '"version"' in line and ":" in line:
-                match = re.search(r'"version"\s*:\s*"([0-9.]+)"', line)
-                if match:
-                    return match.group(1)
-            if "X-AppImage-Version=" in line:
-                version = line.split("=", 1)[1].strip()
-                if version:
-                    return version
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
+        with open(appimage_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as data:
+                return _find_embedded_version(data)
+    except (OSError, ValueError):
         pass
 
-    return extract_version_from_filename(appimage_path.name)
+    return None
 
 
-def _find_cursor_appimage_in_dir(directory: Path) -> Optional[Path]:
-    """Find cursor AppImage file in directory (case-insensitive)."""
-    if not directory.exists():
+def extract_version_from_appimage(appimage_path: Path) -> Optional[str]:
+    """Extract version from AppImage file (filename, cache, or embedded metadata)."""
+    if version := extract_version_from_filename(appimage_path.name):
+        return version
+
+    try:
+        stat = appimage_path.stat()
+    except OSError:
         return None
 
+    if version := AppImageVersionCache.load(appimage_path, stat):
+        return version
+
+    version = _read_appimage_version(appimage_path)
+    if version:
+        AppImageVersionCache.save(appimage_path, stat, version)
+    return version
+
+
+def _find_cursor_appimage_in_dir(directory: Path) -> Optional[Path]:
+    """Find cursor AppImage file in directory (case-insensitive)."""
     # Check exact path first (case-sensitive)
-    if CURSOR_APPIMAGE.exists() and CURSOR_APPIMAGE.parent == directory:
+    if CURSOR_APPIMAGE.parent == directory and CURSOR_APPIMAGE.exists():
         return CURSOR_APPIMAGE
 
-    # Case-insensitive search using glob patterns
-    for pattern in CURSOR_APPIMAGE_PATTERNS:
-        matches = [f for f in directory.glob(pattern) if f.is_file()]
-        if matches:
+    # One directory pass, bucketing names by the first pattern they match
+    matches: list[list[Path]] = [[] for _ in _APPIMAGE_NAME_RES]
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                for bucket, name_re in zip(matches, _APPIMAGE_NAME_RES):
+                    if name_re.match(entry.name):
+                        if entry.is_file():
+                            bucket.append(directory / entry.name)
+                        break
+    except OSError:
+        return None
+
+    for bucket in matches:
+        if bucket:
             # Prefer exact match (case-insensitive)
-            for match in matches:
+            for match in bucket:
                 if match.name.lower() == "cursor.appimage":
                     return match
-            return matches[0]
+            return bucket[0]
 
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _local_bin_appimage() -> Optional[Path]:
+    """Find the installed cursor AppImage in ~/.local/bin, looked up once."""
+    return _find_cursor_appimage_in_dir(CURSOR_APPIMAGE.parent)
+
+
+@functools.lru_cache(maxsize=16)
 def _get_version_from_path(appimage_path: Path) -> Optional[str]:
-    """Extract version from an AppImage path if it exists."""
+    """Extract version from an AppImage path if it exists (memoized per path)."""
     if not appimage_path.exists():
         return None
     return extract_version_from_appimage(appimage_path)
 
 
-def _collect_versions_from_directory(directory: Path) -> list[str]:
-    """Collect all versions from AppImage files in a directory (deduplicated)."""
-    if not directory.exists():
-        return []
-
-    versions = set()
+def _collect_versions_from_directory(directory: Path) -> dict[str, Path]:
+    """Map versions to AppImage files in a directory (deduplicated)."""
+    versions: dict[str, Path] = {}
     seen_files = set()
 
-    for pattern in CURSOR_VERSIONED_PATTERNS:
-        for appimage in directory.glob(pattern):
-            # Avoid processing the same file multiple times (case variations)
-            file_key = appimage.resolve()
-            if file_key in seen_files:
-                continue
-            seen_files.add(file_key)
+    try:
+        with os.scandir(directory) as entries:
+            names = [entry.name for entry in entries]
+    except OSError:
+        return versions
+
+    candidates = []
+    for name in names:
+        if not _VERSIONED_NAME_RE.match(name):
+            continue
+        appimage = directory / name
+
+        # Avoid processing the same file multiple times (case variations)
+        try:
+            st = appimage.stat()
+            file_key = (st.st_dev, st.st_ino)
+        except OSError:
+            file_key = appimage
+        if file_key in seen_files:
+            continue
+        seen_files.add(file_key)
+        candidates.append((name, appimage, extract_version_from_filename(name)))
+
+    # Names without a version need a subprocess each, so read them concurrently
+    unversioned = [appimage for _, appimage, version in candidates if not version]
+    if unversioned:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(unversioned))) as executor:
+            extracted = iter(executor.map(extract_version_from_appimage, unversioned))
+        candidates = [
+            (name, appimage, version or next(extracted))
+            for name, appimage, version in candidates
+        ]
+
+    for name, appimage, version in candidates:
+        # Prefer the canonical file name when case variants share a version
+        if version and (version not in versions or name.endswith(".AppImage")):
+            versions[version] = appimage
+
+    return versions
+
 
-            version = extract_version_from_filename(
-                appimage.name
-            ) or extract_version_from_appimage(appimage)
-            if version:
-                versions.add(version)
+@functools.lru_cache(maxsize=1)
+def list_local_appimages() -> dict[str, Path]:
+    """Map versions to downloaded AppImage files, scanning the directory once.
 
-    return list(versions)
+    Call list_local_appimages.cache_clear() after the downloads change.
+    """
+    return _collect_versions_from_directory(DOWNLOADS_DIR)
 
 
 def get_local_version() -> Optional[str]:
@@ -356,8 +650,7 @@ def get_local_version() -> Optional[str]:
         return version
 
     # Priority 3: Check standard location (case-insensitive)
-    local_bin = CURSOR_APPIMAGE.parent
-    appimage_path = _find_cursor_appimage_in_dir(local_bin)
+    appimage_path = _local_bin_appimage()
     if appimage_path and (version := _get_version_from_path(appimage_path)):
         return version
 
@@ -369,18 +662,17 @@ def get_latest_local_version() -> Optional[str]:
     versions = set()
 
     # Check downloads directory (case-insensitive)
-    versions.update(_collect_versions_from_directory(DOWNLOADS_DIR))
+    versions.update(list_local_appimages())
 
     # Check actual installation location
-    local_bin = CURSOR_APPIMAGE.parent
-    if local_bin.exists():
+    if CURSOR_APPIMAGE.parent.exists():
         # Check desktop file Exec path
         desktop_exec = get_desktop_file_exec()
         if desktop_exec and (version := _get_version_from_path(Path(desktop_exec))):
             versions.add(version)
 
         # Check for any cursor appimage in ~/.local/bin
-        appimage_path = _find_cursor_appimage_in_dir(local_bin)
+        appimage_path = _local_bin_appimage()
         if appimage_path and (version := _get_version_from_path(appimage_path)):
             versions.add(version)
 
@@ -390,65 +682,86 @@ def get_latest_local_version() -> Optional[str]:
     return sort_versions(list(versions))[0]
 
 
+@functools.lru_cache(maxsize=1)
 def get_desktop_file_exec() -> Optional[str]:
     """Get the Exec path from the desktop file."""
-    if not DESKTOP_FILE.exists():
-        return None
-
     try:
-        with open(DESKTOP_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("Exec="):
-                    exec_line = line[5:].strip()
-                    return exec_line.split()[0] if exec_line.split() else exec_line
+        with open(DESKTOP_FILE, "rb") as f:
+            data = b"\n" + f.read()  # so an Exec= on the first line also matches
     except OSError:
-        pass
+        return None
 
-    return None
+    start = data.find(b"\nExec=")
+    if start == -1:
+        return None
+    end = data.find(b"\n", start + 1)
+    try:
+        exec_line = data[start + 6 : end if end != -1 else None].decode().strip()
+    except UnicodeDecodeError:
+        return None
+    return exec_line.split()[0] if exec_line.split() else exec_line
 
 
-def get_launch_info() -> dict:
+@_ttl_cache(STATUS_CACHE_MAX_AGE)
+def get_launch_info() -> LaunchInfo:
     """Get information about how Cursor is launched."""
-    info = {
-        "running_from": None,
-        "desktop_file_exec": None,
-        "symlink_target": None,
-        "symlink_exists": False,
-        "symlink_path": None,
-        "in_path": False,
-    }
+    info = LaunchInfo()
 
     running_path = get_running_cursor_path()
     if running_path:
-        info["running_from"] = str(running_path.resolve())
+        info.running_from = str(running_path)  # already resolved
 
     desktop_exec = get_desktop_file_exec()
     if desktop_exec:
-        info["desktop_file_exec"] = desktop_exec
+        info.desktop_file_exec = desktop_exec
+        info.desktop_file_target = os.path.realpath(desktop_exec)
 
     # Check for cursor appimage (case-insensitive)
-    local_bin = CURSOR_APPIMAGE.parent
-    appimage_path = _find_cursor_appimage_in_dir(local_bin)
+    appimage_path = _local_bin_appimage()
     if appimage_path:
-        info["symlink_exists"] = True
-        info["symlink_path"] = str(appimage_path)
-        if appimage_path.is_symlink():
-            try:
-                info["symlink_target"] = str(appimage_path.readlink().resolve())
-            except OSError:
-                pass
+        info.symlink_exists = True
+        info.symlink_path = str(appimage_path)
+        try:
+            target = os.readlink(appimage_path)
+        except OSError:
+            pass  # Not a symlink
+        else:
+            info.symlink_target = os.path.realpath(
+                os.path.join(appimage_path.parent, target)
+            )
 
-    local_bin_str = str(Path.home() / ".local" / "bin")
+    local_bin_str = str(CURSOR_APPIMAGE.parent)
     path_env = os.environ.get("PATH", "")
-    info["in_path"] = local_bin_str in path_env.split(":")
+    info.in_path = f":{local_bin_str}:" in f":{path_env}:"
 
     return info
 
 
+@_ttl_cache(STATUS_CACHE_MAX_AGE)
 def get_version_status() -> VersionInfo:
     """Get all version information."""
+    # The lookups share memoized probes (process scan, desktop file,
+    # ~/.local/bin, downloads, version history), so each runs once here
     return VersionInfo(
         local=get_local_version(),
         latest_local=get_latest_local_version(),
         latest_remote=get_latest_remote_version(),
     )
+
+
+def clear_local_caches() -> None:
+    """Forget memoized local state (downloads, running process, desktop file)."""
+    list_local_appimages.cache_clear()
+    get_running_cursor_path.cache_clear()
+    get_desktop_file_exec.cache_clear()
+    _local_bin_appimage.cache_clear()
+    _get_version_from_path.cache_clear()
+
+
+def clear_caches() -> None:
+    """Forget all memoized results, e.g. after an update completes."""
+    clear_local_caches()
+    _FRESH_HISTORY.clear()
+    _DOWNLOAD_URLS.clear()
+    get_launch_info.cache_clear()
+    get_version_status.cache_clear()
@@ -0,0 +1,152 @@
+"""Tests for resumable and parallel downloads against a local HTTP server."""
+
+import http.server
+import os
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from cursor_updater.config import CHUNK_SIZE, DOWNLOAD_WORKERS
+from cursor_updater.download import download_file
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PAYLOAD = os.urandom(DOWNLOAD_WORKERS * CHUNK_SIZE * 2)
+SLICE_SIZE = 64 * 1024
+
+
+class _RangeHandler(http.server.BaseHTTPRequestHandler):
+    """Serves PAYLOAD with Range support, optionally throttled or truncated."""
+
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+    accept_ranges = True
+    truncate_after = None  # close the connection after this many body bytes
+    range_shift = 0  # answer range requests from the wrong offset
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if match and self.accept_ranges:
+            start = int(match[1]) + self.range_shift
+            end = int(match[2]) if match[2] else len(PAYLOAD) - 1
+            body = PAYLOAD[start : end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        else:
+            body = PAYLOAD
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.truncate_after is not None:
+            body = body[: self.truncate_after]
+            self.close_connection = True
+        try:
+            for offset in range(0, len(body), SLICE_SIZE):
+                self.wfile.write(body[offset : offset + SLICE_SIZE])
+                if self.delay:
+                    time.sleep(self.delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class DownloadFileTest(unittest.TestCase):
+    def setUp(self):
+        _RangeHandler.delay = 0.0
+        _RangeHandler.accept_ranges = True
+        _RangeHandler.truncate_after = None
+        _RangeHandler.range_shift = 0
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/cursor.AppImage"
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.target = Path(tmp.name) / "cursor-1.0.0.AppImage"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def assert_downloaded(self):
+        self.assertEqual(self.target.read_bytes(), PAYLOAD)
+        self.assertEqual(
+            sorted(p.name for p in self.target.parent.iterdir()), [self.target.name]
+        )
+
+    def test_parallel_download(self):
+        self.assertTrue(download_file(self.url, self.target))
+        self.assert_downloaded()
+
+    def test_single_download_without_ranges(self):
+        _RangeHandler.accept_ranges = False
+        self.assertTrue(download_file(self.url, self.target))
+        self.assert_downloaded()
+
+    def test_resumes_partial_file(self):
+        partial = self.target.with_name(f"{self.target.name}.part")
+        partial.write_bytes(PAYLOAD[: CHUNK_SIZE + 123])
+        self.assertTrue(download_file(self.url, self.target))
+        self.assert_downloaded()
+
+    def test_truncated_body_is_kept_for_resume(self):
+        _RangeHandler.accept_ranges = False
+        _RangeHandler.truncate_after = len(PAYLOAD) // 2
+        self.assertFalse(download_file(self.url, self.target))
+        self.assertFalse(self.target.exists())
+        partial = self.target.with_name(f"{self.target.name}.part")
+        self.assertEqual(partial.read_bytes(), PAYLOAD[: len(PAYLOAD) // 2])
+
+        _RangeHandler.accept_ranges = True
+        _RangeHandler.truncate_after = None
+        self.assertTrue(download_file(self.url, self.target))
+        self.assert_downloaded()
+
+    def test_resume_at_wrong_offset_is_rejected(self):
+        partial = self.target.with_name(f"{self.target.name}.part")
+        partial.write_bytes(PAYLOAD[:CHUNK_SIZE])
+        _RangeHandler.range_shift = 1
+        self.assertFalse(download_file(self.url, self.target))
+        self.assertFalse(self.target.exists())
+        self.assertEqual(partial.read_bytes(), PAYLOAD[:CHUNK_SIZE])
+
+    def test_killed_parallel_download_is_not_installed_corrupted(self):
+        # Each range takes well over a second, so the kill lands mid-transfer
+        _RangeHandler.delay = 0.05
+        script = (
+            "import sys; from pathlib import Path;"
+            "from cursor_updater.download import download_file;"
+            "download_file(sys.argv[1], Path(sys.argv[2]))"
+        )
+        child = subprocess.Popen(
+            [sys.executable, "-c", script, self.url, str(self.target)],
+            cwd=REPO_ROOT,
+            stdout=subprocess.DEVNULL,
+        )
+        work_path = self.target.with_name(f"{self.target.name}.parallel")
+        deadline = time.monotonic() + 10
+        while not work_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(work_path.exists())
+        time.sleep(0.1)
+        child.send_signal(signal.SIGKILL)
+        child.wait()
+        self.assertTrue(work_path.exists())
+        self.assertFalse(self.target.exists())
+
+        _RangeHandler.delay = 0.0
+        self.assertTrue(download_file(self.url, self.target))
+        self.assertFalse(work_path.exists())
+        self.assert_downloaded()
+
+
+if __name__ == "__main__":
+    unittest.main()